@@ -12,7 +12,7 @@
 from requests import URL, Text, Element, HTMLParser
 from cssparser import CSSParser, style, cascade_priority
 from layout import DocumentLayout, tree_to_list, paint_tree
-from drawing import DrawText, DrawLine, DrawRect, DrawOutline, Rect
+from drawing import DrawText, DrawLine, DrawRect, DrawOutline, Rect, ItemPool
 from fonts import get_font
 
 # First-party constant imports
@@ -20,14 +20,53 @@ from constants import WIDTH, HEIGHT, CANVAS_WIDTH, CANVAS_HEIGHT, SCROLL_STEP, D
 
 # Standard library imports
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from array import array
+from operator import attrgetter
+import bisect
+import heapq
 import sys
 
 # ==============================================================================
 # GLOBAL VARIABLES AND CONSTANTS
 # ==============================================================================
 
-# Default CSS rules applied to all pages
-DEFAULT_STYLE_SHEET = CSSParser(open("browser.css").read()).parse()
+# Default CSS rules applied to all pages, parsed once and pre-sorted by cascade priority
+DEFAULT_STYLE_SHEET = tuple(sorted(CSSParser(open("browser.css").read()).parse(), key=cascade_priority))
+
+# Parsed linked stylesheets keyed by resolved URL, each list already sorted by cascade priority
+# so revisiting a page (or opening it in another tab) skips both the fetch and the parse
+_CSS_CACHE: dict[str, list] = {}
+
+# Maximum number of linked stylesheets fetched at the same time
+STYLESHEET_FETCH_WORKERS = 8
+
+# Height in pixels of the rows layout boxes are bucketed into for click hit-testing
+HIT_ROW_HEIGHT = 64
+
+# Parsed HTML trees of recently fetched web pages keyed by URL, least recently used first,
+# so going back to a page skips fetching and parsing it again. Bounded to TREE_CACHE_SIZE
+# pages, which keeps memory to a handful of DOM trees.
+_TREE_CACHE: OrderedDict[str, Element] = OrderedDict()
+TREE_CACHE_SIZE = 16
+
+def fetch_stylesheet(style_url: URL) -> str | None:
+    """
+    Fetch a linked stylesheet, returning None if it couldn't be loaded.
+
+    Anything but a 200 response (including the blank page request() falls back to
+    when the connection fails) counts as a failure, so it isn't cached and the
+    stylesheet is fetched again on the next load.
+
+    :param style_url: URL of the stylesheet
+    :return: CSS text, or None on failure
+    """
+    try:
+        body = style_url.request()
+    except Exception:
+        return None
+    return body if style_url.status == "200" else None
 
 # ==============================================================================
 # MAIN BROWSER CLASS
@@ -55,6 +94,18 @@ class Browser:
         # Tab management
         self.tabs = []           # List of all open tabs
         self.active_tab = None   # Currently visible tab
+
+        # Canvas items currently drawn for the active tab's page as (item type, item id), keyed by
+        # display list index. Page items are tagged "page" and chrome items "chrome" so each can be
+        # updated on its own
+        self._canvas_items_page = {}
+
+        # Pending redraw state, so bursts of events are coalesced into a single draw when Tk is idle
+        self._draw_pending = False       # Whether a draw has been scheduled with after_idle
+        self._pending_full = False       # Whether the next draw must repaint everything
+        self._pending_chrome = False     # Whether the next draw must repaint the chrome
+        self._pending_scroll = None      # Scroll position of the active tab before the first undrawn scroll
+        self._resize_job = None          # Pending after() id for the debounced resize
         
         # Create the main browser window
         self.window = tk.Tk()
@@ -80,26 +131,36 @@ class Browser:
         # ==============================================================================
         # The Browser class handles ALL events and forwards them to appropriate handlers
         
+        # Handlers are bound directly (rather than through lambdas) to save a call per event
         # Keyboard scrolling events
-        self.canvas.bind("<Up>", lambda e: self.handle_scroll_up())   
-        self.canvas.bind("<Down>", lambda e: self.handle_scroll_down())
-        self.canvas.bind("<Page_Up>", lambda e: self.handle_page_up())
-        self.canvas.bind("<Page_Down>", lambda e: self.handle_page_down())
+        self.canvas.bind("<Up>", self.handle_scroll_up)
+        self.canvas.bind("<Down>", self.handle_scroll_down)
+        self.canvas.bind("<Page_Up>", self.handle_page_up)
+        self.canvas.bind("<Page_Down>", self.handle_page_down)
         
         # Mouse wheel scrolling (Linux)
-        self.window.bind("<Button-4>", lambda e: self.handle_scroll_up())
-        self.window.bind("<Button-5>", lambda e: self.handle_scroll_down())
+        self.window.bind("<Button-4>", self.handle_scroll_up)
+        self.window.bind("<Button-5>", self.handle_scroll_down)
         
         # Mouse clicks
-        self.window.bind("<Button-1>", lambda e: self.handle_click(e))
+        self.window.bind("<Button-1>", self.handle_click)
         
         # Window resize events
-        self.canvas.bind("<Configure>", lambda e: self.handle_resize(e))
+        self.canvas.bind("<Configure>", self.handle_resize)
         
         # Keyboard input for address bar
         self.window.bind("<Key>", self.handle_key)     # Individual characters
         self.window.bind("<Return>", self.handle_enter) # Enter key
 
+        # Hidden canvas items waiting to be reused, page and chrome items are recycled rather than deleted
+        self._item_pool = ItemPool(self.canvas)
+
+        # (item type, item id) of the chrome's canvas items, in drawing order
+        self._canvas_items_chrome = []
+
+        # Chrome drawing commands currently on the canvas, to skip redrawing an unchanged chrome
+        self._chrome_drawn_cmds = None
+
         # Create the chrome (browser UI) - tab bar, address bar, etc.
         self.chrome = Chrome(self)
 
@@ -117,36 +178,40 @@ class Browser:
         
         # Forward to chrome (which handles address bar input)
         self.chrome.keypress(e.char)
-        self.draw()  # Redraw to show new character
+        self.schedule_draw_chrome()  # Only the address bar changed, page content is untouched
 
     def handle_enter(self, e: tk.Event):
         """Handle Enter key press (for submitting address bar)."""
         self.chrome.enter()
-        self.draw()
+        self.schedule_draw()
 
-    def handle_scroll_up(self):
+    def handle_scroll_up(self, e: tk.Event | None = None):
         """Scroll the active tab up by one step."""
         if self.active_tab:
+            old_scroll = self.active_tab.scroll
             self.active_tab.scroll_up()
-            self.draw()
+            self.schedule_draw_scroll(old_scroll)
 
-    def handle_scroll_down(self):
+    def handle_scroll_down(self, e: tk.Event | None = None):
         """Scroll the active tab down by one step."""
         if self.active_tab:
+            old_scroll = self.active_tab.scroll
             self.active_tab.scroll_down()
-            self.draw()
+            self.schedule_draw_scroll(old_scroll)
 
-    def handle_page_up(self):
+    def handle_page_up(self, e: tk.Event | None = None):
         """Scroll the active tab up by one page."""
         if self.active_tab:
+            old_scroll = self.active_tab.scroll
             self.active_tab.scroll_page_up()
-            self.draw()
+            self.schedule_draw_scroll(old_scroll)
 
-    def handle_page_down(self):
+    def handle_page_down(self, e: tk.Event | None = None):
         """Scroll the active tab down by one page."""
         if self.active_tab:
+            old_scroll = self.active_tab.scroll
             self.active_tab.scroll_page_down()
-            self.draw()
+            self.schedule_draw_scroll(old_scroll)
 
     def handle_click(self, e: tk.Event):
         """
@@ -167,24 +232,82 @@ class Browser:
             tab_y = e.y - self.chrome.bottom
             if self.active_tab:
                 self.active_tab.click(e.x, tab_y)
-        self.draw()
+        self.schedule_draw()
 
     def handle_scroll(self, action, value):
         """Handle scrollbar drag events."""
         if self.active_tab:
+            old_scroll = self.active_tab.scroll
             self.active_tab.move(action, value)
-            self.draw()
+            self.schedule_draw_scroll(old_scroll)
 
     def handle_resize(self, event):
-        """Handle window resize events."""
+        """
+        Handle window resize events.
+
+        Tk fires many <Configure> events while the window is being dragged, so the
+        relayout is debounced until the size has been stable for 50ms.
+        """
+        if self._resize_job is not None:
+            self.canvas.after_cancel(self._resize_job)
+        self._resize_job = self.canvas.after(50, lambda: self.resize(event))
+
+    def resize(self, event):
+        """Re-layout the active tab for the new window size and redraw."""
+        self._resize_job = None
         if self.active_tab:
             self.active_tab.window_resize(event)
-            self.draw()
+            self.schedule_draw()
 
     # ==============================================================================
     # DRAWING AND TAB MANAGEMENT
     # ==============================================================================
 
+    def schedule_draw(self):
+        """Schedule a full redraw for when Tk is idle."""
+        self._pending_full = True
+        self._request_draw()
+
+    def schedule_draw_chrome(self):
+        """Schedule a redraw of just the chrome for when Tk is idle."""
+        self._pending_chrome = True
+        self._request_draw()
+
+    def schedule_draw_scroll(self, old_scroll: int):
+        """
+        Schedule a scroll update for when Tk is idle.
+
+        Only the scroll position from before the first undrawn scroll is kept, so
+        several scroll steps are drawn as a single translation.
+
+        :param old_scroll: Scroll position of the active tab before it scrolled
+        """
+        if self._pending_scroll is None:
+            self._pending_scroll = old_scroll
+        self._request_draw()
+
+    def _request_draw(self):
+        """Register the idle callback unless one is already pending."""
+        if not self._draw_pending:
+            self._draw_pending = True
+            self.canvas.after_idle(self._do_draw)
+
+    def _do_draw(self):
+        """Perform all the drawing requested since the last idle callback."""
+        full, chrome, old_scroll = self._pending_full, self._pending_chrome, self._pending_scroll
+        self._draw_pending = False
+        self._pending_full = False
+        self._pending_chrome = False
+        self._pending_scroll = None
+
+        if full:
+            self.draw()
+            return
+        if old_scroll is not None:
+            self.draw_scroll(old_scroll)
+        if chrome:
+            self.draw_chrome_only()
+
     def draw(self):
         """
         Main drawing method - renders the entire browser window.
@@ -194,16 +317,69 @@ class Browser:
         2. Draw the active tab's page content (if any)
         3. Draw the chrome UI on top (tab bar, address bar, back button, etc.)
         """
-        self.canvas.delete("all")  # Clear everything
+        # Clear the page, hiding its items in the pool so they can be reused
+        for item_type, item in self._canvas_items_page.values():
+            self._item_pool.release(item_type, item)
+        self._canvas_items_page = {}
         
         # Draw the active tab's content first (so chrome appears on top)
         if self.active_tab:
             # Pass chrome.bottom as offset so tab content appears below chrome
-            self.active_tab.draw(self.canvas, self.chrome.bottom)
+            self.active_tab.draw(self.canvas, self.chrome.bottom, self._canvas_items_page, self._item_pool)
+        self._item_pool.hide_released()  # Hide old page items that weren't reused
+        
+        # Draw chrome UI on top
+        self.draw_chrome_only()
+
+    def draw_chrome_only(self):
+        """
+        Redraw just the chrome UI, leaving the page content items in place.
+
+        Used when only chrome state changed (e.g. typing in the address bar). If the
+        chrome hasn't changed since it was last drawn its canvas items are kept and just
+        raised back above the page.
+        """
+        cmds = self.chrome.paint()
+        if cmds is self._chrome_drawn_cmds:
+            self.canvas.tag_raise("chrome")
+            return
         
-        # Draw chrome UI on top (with scroll=0 so it never scrolls)
-        for cmd in self.chrome.paint():
-            cmd.execute(0, self.canvas)  # scroll=0 keeps chrome fixed
+        # Recycle the old chrome items instead of deleting them and creating new ones
+        for item_type, item in self._canvas_items_chrome:
+            self._item_pool.release(item_type, item)
+        self._canvas_items_chrome = [
+            (cmd.item_type, cmd.execute(0, self.canvas, "chrome", self._item_pool.acquire(cmd.item_type)))  # scroll=0 keeps chrome fixed
+            for cmd in cmds
+        ]
+        self._item_pool.hide_released()
+        self._chrome_drawn_cmds = cmds
+
+    def draw_scroll(self, old_scroll: int):
+        """
+        Update the canvas after the active tab scrolled, without repainting everything.
+
+        Scrolling is a pure translation of the page, so the existing page items are
+        moved by the scroll delta and only commands entering or leaving the viewport
+        are created or deleted. If the newly exposed strip is more than half the
+        window, a full redraw is cheaper and is used instead.
+
+        :param old_scroll: Scroll position of the active tab before it scrolled
+        """
+        if not self.active_tab:
+            return
+        dy = old_scroll - self.active_tab.scroll
+        if dy == 0:
+            return
+
+        # Dirty area is the strip of page uncovered by the scroll
+        dirty_area = WIDTH * abs(dy)
+        if dirty_area > WIDTH * HEIGHT / 2:
+            return self.draw()
+
+        self.canvas.move("page", 0, dy)
+        self.active_tab.draw(self.canvas, self.chrome.bottom, self._canvas_items_page, self._item_pool, old_scroll)
+        self._item_pool.hide_released()  # Scrolled-out items must not reappear on a later move
+        self.canvas.tag_raise("chrome")  # Newly created page items must stay below the chrome
 
     def new_tab(self, url):
         """
@@ -221,9 +397,10 @@ class Browser:
         # Make this the active tab and add to tabs list
         self.active_tab = new_tab
         self.tabs.append(new_tab)
+        self.chrome.invalidate()  # The tab bar gained a tab
         
         # Redraw to show the new tab
-        self.draw()
+        self.schedule_draw()
 
 # ==============================================================================
 # TAB CLASS
@@ -261,7 +438,15 @@ class Tab:
         self.scroll = 0              # Current scroll position (Rename to scroll positon?)
         self.url = None              # Current page URL
         self.document = None         # Root of layout tree
-        self.display_list = []       # List of drawing commands for page content
+        self.display_list = []       # List of drawing commands for page content, sorted by top
+        self._tops = array("d")          # Top of each display list command, for bisecting the viewport
+        self._bottoms = array("d")       # Bottom of each display list command, for culling
+        self._max_bottoms = array("d")   # Running maximum of short command bottoms, for bisecting the viewport
+        self._tall = []              # Indices of commands taller than the window, culled separately
+        self._hit_boxes = []         # (left, top, right, bottom) of every layout object, in tree order
+        self._flat_layout = []       # Layout tree flattened in tree order (matches _hit_boxes index for index)
+        self._hit_rows = {}          # Row number -> indices of the boxes overlapping that row, in tree order
+        self._flat_dom = []          # HTML tree flattened in tree order
         self.content_height = 0      # Total height of page content
 
     def go_back(self):
@@ -271,8 +456,8 @@ class Tab:
             self.history.pop()
             # Get previous page
             back = self.history.pop()
-            # Load it (this will add it back to history)
-            self.load(back)
+            # Load it (this will add it back to history), reusing its parsed tree if still cached
+            self.load(back, use_cache=True)
 
     # ==============================================================================
     # SCROLLING METHODS
@@ -336,19 +521,19 @@ class Tab:
         if not self.document:
             return
             
-        # Find all layout objects that contain the click point
-        # tree_to_list flattens the layout tree into a list
-        objs = [obj for obj in tree_to_list(self.document, []) if obj.x <= x < obj.x + obj.width and obj.y <= y < obj.y + obj.height]
-        
-        if not objs: 
+        # Find the most specific (deepest) layout object that contains the click point
+        # The boxes are in tree order, so the x and y values become more and more "true"
+        # as we go deeper into the tree, this means the last matching box is the most specific
+        # element and the element we want to interact with. Scanning backwards lets us stop
+        # at the first match, and only the boxes overlapping the clicked row need checking
+        for i in reversed(self._hit_rows.get(int(y // HIT_ROW_HEIGHT), ())):
+            left, top, right, bottom = self._hit_boxes[i]
+            if left <= x < right and top <= y < bottom:
+                break
+        else:
             return  # Click didn't hit any content
-            
-        # Get the most specific (deepest) element at the click position
-        # objs[-1] is the last in the list, which is the most nested
-        # When looping to create the list the x and y values will become more and more "true"
-        # as we go deeper into the tree, this means the last element is the most specific element
-        # and the element we want to interact with
-        elt = objs[-1].node
+
+        elt = self._flat_layout[i].node
         
         # Walk up the DOM tree looking for a clickable element, though we got the most specific element
         # we still need to check if it is a link or not, as the most specific element may not be a link
@@ -373,18 +558,28 @@ class Tab:
     # ==============================================================================
 
     def window_resize(self, e: tk.Event):
-        """Handle window resize by re-laying out the page."""
+        """
+        Handle window resize by re-laying out the page.
+
+        Layout only depends on the width, so when just the height changed (or Tk sent
+        a no-op <Configure>) only the viewport is updated and the layout is kept.
+        """
         global CANVAS_WIDTH, CANVAS_HEIGHT
+        width_changed = e.width != CANVAS_WIDTH
         CANVAS_WIDTH, CANVAS_HEIGHT = e.width, e.height
+        self.tab_height = e.height - self.browser.chrome.bottom
+
+        if not width_changed:
+            self.update_scroll_region()
+            return
 
         if hasattr(self, 'document') and self.document:
             # Re-layout with new dimensions
             self.document.layout()
-            self.display_list = []
-            paint_tree(self.document, self.display_list)
+            self.paint_display_list()
             self.update_scroll_region()
 
-    def load(self, url: URL):
+    def load(self, url: URL, use_cache: bool = False):
         """
         Load a new page from the given URL.
         
@@ -398,10 +593,12 @@ class Tab:
         7. Update scrolling region
 
         :param url: URL object representing the page to load
+        :param use_cache: Reuse a cached parse of a web page instead of fetching it again
         """
         # Add to browsing history
         self.history.append(url)
         self.url = url
+        self.browser.chrome.invalidate()  # The address bar shows the new URL
         
         # ==============================================================================
         # STEP 1: FETCH AND PARSE HTML
@@ -423,46 +620,70 @@ class Tab:
             # Show page source as plain text
             body = url.request()
             tree = Text(body, None)
+        elif use_cache and str(url) in _TREE_CACHE:
+            # Recently visited web page, reuse its tree (styles are recomputed below)
+            tree = _TREE_CACHE[str(url)]
+            _TREE_CACHE.move_to_end(str(url))
         else:
-            # Fetch from web server
-            body = url.request()
-            tree = HTMLParser(body).parse()
+            # Fetch from web server, parsing each chunk while the rest is still downloading
+            parser = HTMLParser()
+            for chunk in url.request_stream():
+                parser.feed(chunk)
+            tree = parser.close()
+
+            # Remember the tree, evicting the least recently used page once the cache is full.
+            # Error and blank fallback pages aren't kept, going back to them fetches again
+            if url.status == "200":
+                _TREE_CACHE[str(url)] = tree
+                _TREE_CACHE.move_to_end(str(url))
+                if len(_TREE_CACHE) > TREE_CACHE_SIZE:
+                    _TREE_CACHE.popitem(last=False)
 
         self.tree = tree  # Store parsed HTML tree
+        self._flat_dom = tree_to_list(tree, [])  # Flattened once, the HTML tree doesn't change until the next load
         
         # ==============================================================================
         # STEP 2: LOAD CSS STYLESHEETS
         # ==============================================================================
         
-        # Start with default browser styles
-        rules = DEFAULT_STYLE_SHEET.copy()
-
         # Find linked stylesheets in the HTML
         links = [ # Figure this out again
             node.attributes["href"]
-            for node in tree_to_list(tree, [])
+            for node in self._flat_dom
             if isinstance(node, Element)
             and node.tag == "link"
             and node.attributes.get("rel") == "stylesheet"
             and "href" in node.attributes
         ]
 
-        # Load each stylesheet and parse its CSS rules
-        for link in links:
-            style_url = url.resolve(link)
-            try:
-                body = style_url.request()
-                rules.extend(CSSParser(body).parse())
-            except:
-                continue  # Skip failed stylesheets
+        # Fetch the stylesheets that aren't cached yet in parallel, so the wait is the
+        # slowest fetch rather than the sum of all of them
+        style_urls = [url.resolve(link) for link in links]
+        keys = [str(style_url) for style_url in style_urls]
+        missing = {key: style_url for key, style_url in zip(keys, style_urls) if key not in _CSS_CACHE}
+        if missing:
+            with ThreadPoolExecutor(max_workers=STYLESHEET_FETCH_WORKERS) as executor:
+                bodies = list(executor.map(fetch_stylesheet, missing.values()))
+
+            # Parse serially, CSS parsing is CPU bound so threads wouldn't help
+            for key, body in zip(missing, bodies):
+                if body is not None:
+                    _CSS_CACHE[key] = sorted(CSSParser(body).parse(), key=cascade_priority)
+
+        # Collect each stylesheet's cached, already sorted rules in document order
+        sheets = [_CSS_CACHE[key] for key in keys if key in _CSS_CACHE]  # Failed stylesheets are skipped
+
+        # Every sheet is already sorted, so a stable merge gives the same order as sorting
+        # the default rules followed by the linked rules, without re-sorting everything
+        rules = list(heapq.merge(DEFAULT_STYLE_SHEET, *sheets, key=cascade_priority))
 
         # ==============================================================================
         # STEP 3: APPLY CSS STYLES
         # ==============================================================================
         
         # Apply all CSS rules to HTML elements
-        # cascade_priority determines which rules take precedence
-        style(self.tree, sorted(rules, key=cascade_priority)) # Figure out how cascade_priority works again
+        # Rules are ordered by cascade_priority so more specific rules are applied last and take precedence
+        style(self.tree, rules)
 
         # ==============================================================================
         # STEP 4: CREATE LAYOUT TREE
@@ -483,20 +704,66 @@ class Tab:
         # STEP 5: GENERATE DISPLAY LIST
         # ==============================================================================
         
-        # Create list of drawing commands from layout tree
-        self.display_list = []
+        # Create list of drawing commands from layout tree (this also calculates the content height)
+        self.paint_display_list()
+        self.update_scroll_region()
+
+    def paint_display_list(self):
+        """
+        Rebuild the display list from the layout tree and index it for fast culling.
+
+        Commands are stably sorted by top (paint order is already almost sorted, and a
+        container's background never starts below its contents) so the first command
+        below the viewport can be found with a binary search. Bottoms are not sorted,
+        since a container extends past its children, so a running maximum of bottoms is
+        kept instead: every command before the first index whose running maximum reaches
+        the viewport is guaranteed to be above it.
+
+        A single tall command near the top (like a page background) would hold that running
+        maximum up for the whole page and make every draw scan from the start, so commands
+        taller than the window are left out of it and listed in _tall to be checked on
+        their own.
+        """
+        # The list and arrays are emptied and refilled in place rather than replaced,
+        # so a relayout doesn't allocate a fresh set of containers every time
+        self.display_list.clear()
         paint_tree(self.document, self.display_list)
-        
-        # Calculate total content height for scrolling
-        if self.display_list:
-            # Find the maximum bottom position of all commands, but only the last command
-            # will be assigned to self.content_height as y coordinates are relative to the top of the canvas
-            # and the bottom of the canvas is at the bottom of the last command
-            self.content_height = max(cmd.bottom for cmd in self.display_list) + VSTEP
-        else:
-            self.content_height = 0
+        self.display_list.sort(key=attrgetter("top"))
+
+        # Bounds are kept in flat typed arrays next to the command list, so culling
+        # reads packed numbers instead of looking up attributes on every command
+        tops, bottoms, max_bottoms = self._tops, self._bottoms, self._max_bottoms
+        del tops[:], bottoms[:], max_bottoms[:]
+        self._tall.clear()
+        max_bottom = lowest_bottom = float("-inf")
+        for i, cmd in enumerate(self.display_list):
+            top, bottom = cmd.top, cmd.bottom
+            if bottom - top > HEIGHT:
+                self._tall.append(i)
+                lowest_bottom = max(lowest_bottom, bottom)
+            elif bottom > max_bottom:
+                max_bottom = bottom
+            tops.append(top)
+            bottoms.append(bottom)
+            max_bottoms.append(max_bottom)
+
+        # Calculate total content height for scrolling, the last running maximum is already
+        # the lowest bottom of any short command so only the few tall ones need comparing
+        lowest_bottom = max(lowest_bottom, max_bottom)
+        self.content_height = lowest_bottom + VSTEP if self.display_list else 0
+
+        # Flatten the layout tree and its bounds once per layout so clicks don't walk the tree
+        self._flat_layout = tree_to_list(self.document, [])
+        self._hit_boxes = [
+            (obj.x, obj.y, obj.x + obj.width, obj.y + obj.height)
+            for obj in self._flat_layout
+        ]
 
-        self.update_scroll_region()
+        # Bucket the boxes into horizontal rows so a click only tests the boxes in its row
+        self._hit_rows = {}
+        for i, (left, top, right, bottom) in enumerate(self._hit_boxes):
+            for row in range(int(top // HIT_ROW_HEIGHT), int(bottom // HIT_ROW_HEIGHT) + 1):
+                self._hit_rows.setdefault(row, []).append(i)
 
     def update_scroll_region(self):
         """Configure the canvas scroll region for this tab's content."""
@@ -548,24 +815,63 @@ class Tab:
 
         self.browser.scrollbar.set(top, bottom)
 
-    def draw(self, canvas: tk.Canvas, offset: float):
+    def draw(self, canvas: tk.Canvas, offset: float, items: dict, pool: ItemPool, old_scroll: float | None = None):
         """
-        Draw this tab's content to the canvas.
+        Draw this tab's visible content to the canvas.
+
+        Commands that already have a canvas item in `items` are left alone, and items
+        whose command has left the visible area are released to the pool, so this works
+        both for a fresh canvas (empty `items`) and for updating after a scroll. New
+        items reuse hidden pooled items where possible instead of creating new ones.
 
         :param canvas: tkinter Canvas to draw on
         :param offset: Vertical offset (height of chrome area)
+        :param items: (item type, item id) keyed by display list index, updated in place
+        :param pool: Pool of hidden canvas items to recycle
+        :param old_scroll: Scroll position `items` were drawn at, if only scrolling since then
         """
-        for cmd in self.display_list:
-            # Skip drawing commands that are outside the visible area
-            if cmd.top > self.scroll + self.tab_height: 
-                continue  # Below visible area
-            if cmd.bottom < self.scroll: 
+        # Bounds live in the packed arrays built by paint_display_list(), read through
+        # locals so the loops below don't look attributes up on every iteration
+        scroll, tops, bottoms = self.scroll, self._tops, self._bottoms
+
+        # Only commands in display_list[lo:hi] can be visible
+        lo = bisect.bisect_left(self._max_bottoms, scroll)
+        hi = bisect.bisect_right(tops, scroll + self.tab_height)
+
+        # Release previously drawn items whose command has left the visible area
+        for i in [i for i in items if not (i < hi and bottoms[i] >= scroll)]:
+            pool.release(*items.pop(i))
+
+        # When scrolling down, every command starting above the old bottom edge was either
+        # already drawn or is still above the viewport, so only the newly exposed strip
+        # at the bottom needs checking
+        start = lo
+        if old_scroll is not None and old_scroll < scroll:
+            start = max(lo, bisect.bisect_right(tops, old_scroll + self.tab_height))
+
+        # Tall commands before the slice aren't covered by the running maximum, so they are
+        # checked on their own, first, to keep them stacked below the commands after them
+        display_list = self.display_list
+        for i in self._tall:
+            if i >= min(start, hi):
+                break  # The rest are handled by the loop below, or start below the viewport
+            if i in items or bottoms[i] < scroll:
+                continue
+            cmd = display_list[i]
+            items[i] = (cmd.item_type, cmd.execute(scroll - offset, canvas, "page", pool.acquire(cmd.item_type)))
+
+        for i in range(start, hi):
+            if i in items:
+                continue  # Already on the canvas, moved into place by the scroll
+            if bottoms[i] < scroll:
                 continue  # Above visible area
             
             # Execute the drawing command with combined scroll and offset
             # self.scroll moves content up/down with page scrolling
             # offset moves content down to make room for chrome at top
-            cmd.execute(self.scroll - offset, canvas)
+            cmd = display_list[i]
+            item = cmd.execute(scroll - offset, canvas, "page", pool.acquire(cmd.item_type))
+            items[i] = (cmd.item_type, item)
 
 # ==============================================================================
 # CHROME (BROWSER UI) CLASS
@@ -643,6 +949,33 @@ class Chrome:
         self.focus = None # Which UI element has focus (None or "address bar")
         self.address_bar = "" # Current text in address bar
 
+        # Tab geometry never changes, so it is measured once rather than per tab_rect() call
+        self._tabs_start = self.newtab_rect.right + self.padding  # Tabs start after the "+" button
+        self._tab_width = self.font.measure("Tab X") + 2 * self.padding  # "Tab X" as width estimate
+
+        # Drawing commands for the parts of the chrome that never change
+        self._static_cmds = [
+            # White background for entire chrome area
+            DrawRect(Rect(0, 0, WIDTH, self.bottom), "white"),
+            # Black line separating chrome from page content
+            DrawLine(0, self.bottom, WIDTH, self.bottom, "black", 1),
+            # Border around "+" button and its text
+            DrawOutline(self.newtab_rect, "black", 1),
+            DrawText(self.newtab_rect.left + self.padding, self.newtab_rect.top, "+", "black", self.font),
+            # Back button border and its "<" symbol
+            DrawOutline(self.back_rect, "black", 1),
+            DrawText(self.back_rect.left + self.padding, self.back_rect.top, "<", "black", self.font),
+        ]
+
+        # Paint cache - the chrome only changes when its state does, so its drawing
+        # commands are kept until invalidate() is called
+        self._dirty = True
+        self._cached_cmds = []
+
+    def invalidate(self):
+        """Mark the chrome as changed so the next paint() regenerates its drawing commands."""
+        self._dirty = True
+
     # ==============================================================================
     # INPUT HANDLING
     # ==============================================================================
@@ -651,10 +984,12 @@ class Chrome:
         """Handle character input (typing in address bar)."""
         if self.focus == "address bar":
             self.address_bar += char  # Add character to address bar text
+            self.invalidate()
 
     def enter(self):
         """Handle Enter key (submit address bar)."""
         if self.focus == "address bar":
+            self.invalidate()
             # Load the URL from address bar in the active tab
             if self.browser.active_tab:
                 self.browser.active_tab.load(URL(self.address_bar))
@@ -671,16 +1006,9 @@ class Chrome:
         :param i: Tab index (0 for first tab, 1 for second, etc.)
         :return: Rect object representing the tab's bounds
         """
-        # Tabs start after the "+" button
-        tabs_start = self.newtab_rect.right + self.padding
-        
-        # Calculate tab width (using "Tab X" as width estimate)
-        tab_width = self.font.measure("Tab X") + 2 * self.padding
-        
-        # Calculate this tab's position
         return Rect(
-            tabs_start + tab_width * i, self.tabbar_top, 
-            tabs_start + tab_width * (i + 1), self.tabbar_bottom
+            self._tabs_start + self._tab_width * i, self.tabbar_top, 
+            self._tabs_start + self._tab_width * (i + 1), self.tabbar_bottom
         )
 
     # ==============================================================================
@@ -691,32 +1019,15 @@ class Chrome:
         """
         Generate drawing commands for the entire chrome UI.
         
+        The commands are cached and returned as the same list until the chrome is invalidated.
+        
         :return: List of drawing command objects
         """
-        cmds = []
-        
-        # ==============================================================================
-        # BACKGROUND AND SEPARATOR
-        # ==============================================================================
+        if not self._dirty:
+            return self._cached_cmds
         
-        # White background for entire chrome area
-        cmds.append(DrawRect(Rect(0, 0, WIDTH, self.bottom), "white"))
-        
-        # Black line separating chrome from page content
-        cmds.append(DrawLine(0, self.bottom, WIDTH, self.bottom, "black", 1))
-        
-        # ==============================================================================
-        # NEW TAB BUTTON
-        # ==============================================================================
-        
-        # Border around "+" button
-        cmds.append(DrawOutline(self.newtab_rect, "black", 1))
-        
-        # "+" text inside button
-        cmds.append(DrawText(
-            self.newtab_rect.left + self.padding, self.newtab_rect.top, 
-            "+", "black", self.font
-        ))
+        # Background, separator, "+" and back buttons are prebuilt in __init__
+        cmds = list(self._static_cmds)
         
         # ==============================================================================
         # TAB BAR
@@ -774,19 +1085,8 @@ class Chrome:
                     url, "black", self.font
                 ))
         
-        # ==============================================================================
-        # BACK BUTTON
-        # ==============================================================================
-        
-        # Back button border
-        cmds.append(DrawOutline(self.back_rect, "black", 1))
-        
-        # "<" symbol in back button
-        cmds.append(DrawText(
-            self.back_rect.left + self.padding, self.back_rect.top, 
-            "<", "black", self.font
-        ))
-        
+        self._cached_cmds = cmds
+        self._dirty = False
         return cmds
 
     # ==============================================================================
@@ -808,6 +1108,7 @@ class Chrome:
         """
         # Remove focus from any previously focused element
         self.focus = None
+        self.invalidate()
         
         # Check which UI element was clicked
         if self.newtab_rect.contains_point(x, y):
@@ -825,11 +1126,12 @@ class Chrome:
                 self.browser.active_tab.go_back()
                 
         else:
-            # Check if a tab was clicked
-            for i, tab in enumerate(self.browser.tabs):
-                if self.tab_rect(i).contains_point(x, y):
-                    self.browser.active_tab = tab  # Switch to clicked tab
-                    break
+            # Check if a tab was clicked - tabs are equal width and side by side (see tab_rect),
+            # so the clicked tab's index is computed directly instead of testing every tab
+            if self.tabbar_top <= y < self.tabbar_bottom and x >= self._tabs_start:
+                i = int((x - self._tabs_start) // self._tab_width)
+                if i < len(self.browser.tabs):
+                    self.browser.active_tab = self.browser.tabs[i]  # Switch to clicked tab
 
 # ==============================================================================
 # MAIN APPLICATION ENTRY POINT
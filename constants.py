@@ -1,6 +1,9 @@
 # Font cache - stores tkinter Font objects to avoid recreating them with each re-draw
 FONTS = {}
 
+# Maximum number of text widths each font remembers
+MEASURE_CACHE_SIZE = 4096
+
 # Browser window dimensions
 WIDTH, HEIGHT = 1280, 720
 CANVAS_WIDTH, CANVAS_HEIGHT = 0, 0
@@ -9,14 +12,14 @@ CANVAS_WIDTH, CANVAS_HEIGHT = 0, 0
 HSTEP, VSTEP = 13, 18
 
 # HTML elements that create block-level layout (as opposed to inline)
-BLOCK_ELEMENTS = [
+BLOCK_ELEMENTS = frozenset([
     "html", "body", "article", "section", "nav", "aside",
     "h1", "h2", "h3", "h4", "h5", "h6", "hgroup", "header",
     "footer", "address", "p", "hr", "pre", "blockquote",
     "ol", "ul", "menu", "li", "dl", "dt", "dd", "figure",
     "figcaption", "main", "div", "table", "form", "fieldset",
     "legend", "details", "summary"
-]
+])
 
 # How many pixels to scroll with each scroll step
 SCROLL_STEP = 20
@@ -24,9 +27,6 @@ SCROLL_STEP = 20
 # Default page to load when no URL is specified
 DEFAULT_PAGE = "file://index.html"
 
-# Default user agent string for HTTP requests
-SOCKET = None
-
 # HTML entities and their replacements
 ENTITIES = {
     "&lt;": "<",
@@ -298,7 +298,27 @@ class DescendantSelector:
 # STYLE APPLICATION ENGINE
 # ==============================================================================
 
-def style(node, rules):
+def index_rules(rules):
+    """
+    Group CSS rules by the tag their selector's rightmost part matches.
+
+    An element can only match a rule if its tag equals the selector's rightmost tag
+    (the descendant part of a descendant selector), so bucketing rules by that tag
+    lets each element test only the rules that could possibly apply to it instead
+    of every rule. Each bucket keeps the rules in their original (cascade) order.
+
+    Example: [(h1, ...), (div p, ...), (p, ...)] → {'h1': [(h1, ...)], 'p': [(div p, ...), (p, ...)]}
+
+    :param rules: List of (selector, properties) CSS rules
+    :return: Dictionary of tag name to list of (selector, properties) rules
+    """
+    rules_by_tag = {}
+    for selector, body in rules:
+        key = selector.descendant.tag if isinstance(selector, DescendantSelector) else selector.tag
+        rules_by_tag.setdefault(key, []).append((selector, body))
+    return rules_by_tag
+
+def style(node, rules, rules_by_tag=None):
     """
     Apply CSS styles to an HTML element and all its children.
     
@@ -306,38 +326,50 @@ def style(node, rules):
     1. Set up inheritance (children get parent styles)
     2. Apply matching CSS rules (more specific rules override less specific)
     3. Resolve relative values (like percentages)
-    4. Recursively style all children
+    4. Move on to all children
+    
+    The tree is walked with an explicit stack rather than recursion, visiting
+    every parent before its children (which inherit from it), so deep pages
+    can't hit the recursion limit.
     
     :param node: HTML Element to style
     :param rules: List of (selector, properties) CSS rules
+    :param rules_by_tag: Rules grouped by index_rules(), computed from rules if not given
     """
-    node.style = {} # Add style attribute here so only exists if needed
+    if rules_by_tag is None:
+        rules_by_tag = index_rules(rules)
 
-    # Apply inherited styles - children inherit certain properties from parents
-    for property, default_value in INHERITED_PROPERTIES.items():
-        if node.parent:
-            # Inherit from parent
-            node.style[property] = node.parent.style[property]
-        else:
-            # Use default value (this is the root element)
-            node.style[property] = default_value
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        node.style = {} # Add style attribute here so only exists if needed
 
-    # Apply matching CSS rules (rules override inheritance)
-    for selector, body in rules:
-        if selector.matches(node):
-            for prop, val in body.items():
-                node.style[prop] = val  # Override inherited/previous values
+        # Apply inherited styles - children inherit certain properties from parents
+        for property, default_value in INHERITED_PROPERTIES.items():
+            if node.parent:
+                # Inherit from parent
+                node.style[property] = node.parent.style[property]
+            else:
+                # Use default value (this is the root element)
+                node.style[property] = default_value
+
+        # Apply matching CSS rules (rules override inheritance)
+        # Only rules whose rightmost tag is this element's tag can match (text nodes match none)
+        candidates = rules_by_tag.get(node.tag, []) if isinstance(node, Element) else []
+        for selector, body in candidates:
+            if selector.matches(node):
+                for prop, val in body.items():
+                    node.style[prop] = val  # Override inherited/previous values
 
-    # Resolve font-size percentages BEFORE visiting children
-    # This ensures children inherit the computed value, not the percentage
-    if "font-size" in node.style and node.style["font-size"].endswith("%"):
-        pct = float(node.style["font-size"][:-1]) / 100
-        if node.parent:
-            parent_size = float(node.parent.style["font-size"][:-2])  # "16px" -> 16
-        else:
-            parent_size = float(INHERITED_PROPERTIES["font-size"][:-2])
-        node.style["font-size"] = f"{pct * parent_size}px"
+        # Resolve font-size percentages BEFORE visiting children
+        # This ensures children inherit the computed value, not the percentage
+        if "font-size" in node.style and node.style["font-size"].endswith("%"):
+            pct = float(node.style["font-size"][:-1]) / 100
+            if node.parent:
+                parent_size = float(node.parent.style["font-size"][:-2])  # "16px" -> 16
+            else:
+                parent_size = float(INHERITED_PROPERTIES["font-size"][:-2])
+            node.style["font-size"] = f"{pct * parent_size}px"
 
-    # Recurse into children - apply styling to all child elements
-    for child in node.children:
-        style(child, rules)
\ No newline at end of file
+        # Visit children next - push in reverse so they're styled in document order
+        stack.extend(reversed(node.children))
@@ -3,6 +3,9 @@ import tkinter.font
 
 class Rect:
     """Represents a rectangle with left, top, right, bottom coordinates."""
+
+    # Pages create thousands of these, slots keep them small and attribute access fast
+    __slots__ = ("left", "top", "right", "bottom")
     
     def __init__(self, left, top, right, bottom):
         self.left = left
@@ -14,9 +17,91 @@ class Rect:
         """Check if a point (x, y) is inside this rectangle."""
         return x >= self.left and x < self.right and y >= self.top and y < self.bottom
 
+class ItemPool:
+    """
+    Keeps hidden canvas items around so they can be recycled instead of recreated.
+
+    Creating a Tk canvas item is much more expensive than reconfiguring an existing
+    one, so items that scroll out of view are hidden and handed out again later.
+
+    Hiding is deferred until hide_released() is called at the end of a draw, so an
+    item released and reused within the same draw (most of them on a full redraw)
+    costs no extra Tcl calls to hide and show it again.
+    """
+
+    def __init__(self, canvas: tkinter.Canvas):
+        """
+        Initialize an empty pool.
+
+        :param canvas: Canvas that owns the pooled items
+        """
+        self.canvas = canvas
+        self.free = {}  # Tk item type ("text", "rectangle", "line") -> list of free item ids
+        self.unhidden = set()  # Free items released since the last hide_released()
+
+    def acquire(self, item_type: str):
+        """Return a free item of the given type to reuse, or None if there isn't one."""
+        free = self.free.get(item_type)
+        if not free:
+            return None
+        item = free.pop()
+        self.unhidden.discard(item)
+        return item
+
+    def release(self, item_type: str, item: int):
+        """Keep an item for reuse, it is hidden by the next hide_released() unless reused first."""
+        self.free.setdefault(item_type, []).append(item)
+        self.unhidden.add(item)
+
+    def hide_released(self):
+        """Hide every released item that wasn't reused, call once a draw is finished."""
+        for item in self.unhidden:
+            self.canvas.itemconfigure(item, state="hidden")
+        self.unhidden.clear()
+
+def draw_item(canvas: tkinter.Canvas, item_type: str, coords: tuple, item=None, **options) -> int:
+    """
+    Create a canvas item, or reconfigure a recycled one to look like a new item.
+
+    :param canvas: Canvas to draw on
+    :param item_type: Tk item type ("text", "rectangle", "line")
+    :param coords: Item coordinates
+    :param item: Hidden item id of the same type to reuse, or None to create a new item
+    :param options: Item options (fill, font, tags, etc.)
+    :return: Canvas item id
+    """
+    if item is None:
+        return getattr(canvas, "create_" + item_type)(*coords, **options)
+    canvas.coords(item, *coords)
+    canvas.itemconfigure(item, state="normal", **options)
+    canvas.tag_raise(item)  # Stack it like a newly created item
+    return item
+
+# Canvas options shared by every text command with the same (font, color)
+TEXT_STYLES = {}
+
+def text_style(font: tkinter.font.Font, color: str) -> dict:
+    """
+    Get the canvas options for text in the given font and color.
+
+    Text commands with the same font and color share one options dict, built
+    the first time the pair is seen, instead of each building its own per draw.
+
+    :param font: tkinter Font object for text styling
+    :param color: Text color
+    :return: Dictionary of font, fill and anchor canvas options
+    """
+    key = (font.name, color)  # tkinter Fonts aren't hashable, but their Tk names are unique
+    if key not in TEXT_STYLES:
+        TEXT_STYLES[key] = {"font": font, "fill": color, "anchor": "nw"}
+    return TEXT_STYLES[key]
+
 class DrawText:
     """Draws text at a specific position with given font and color."""
 
+    item_type = "text"
+    __slots__ = ("top", "left", "text", "font", "color", "style", "bottom")
+
     def __init__(self, x1: int, y1: int, text: str, color: str, font: tkinter.font.Font):
         """
         Initialize a text drawing command.
@@ -32,43 +117,48 @@ class DrawText:
         self.text = text
         self.font = font
         self.color = color
-        self.bottom = y1 + font.metrics("linespace")
-        
-        text_width = font.measure(text)
-        text_height = font.metrics("linespace")
-        self.rect = Rect(x1, y1, x1 + text_width, y1 + text_height)
-
-    def execute(self, scroll: int, canvas: tkinter.Canvas):
-        """Draw the text on the canvas."""
-        canvas.create_text(
-            self.left,
-            self.top - scroll,
-            text=self.text,
-            font=self.font,
-            fill=self.color,
-            anchor="nw"
+        self.style = text_style(font, color)
+        self.bottom = y1 + font.linespace
+
+    @property
+    def rect(self) -> Rect:
+        """Bounds of the text, measured on demand since drawing only needs top and bottom."""
+        return Rect(self.left, self.top, self.left + self.font.measure(self.text), self.bottom)
+
+    def execute(self, scroll: int, canvas: tkinter.Canvas, tags: str | tuple = (), item=None) -> int:
+        """Draw the text on the canvas (reusing `item` if given) and return the canvas item id."""
+        return draw_item(
+            canvas, self.item_type,
+            (self.left, self.top - scroll),
+            item, text=self.text, tags=tags, **self.style
         )
 
 class DrawLine:
     """Draws a line between two points."""
 
+    item_type = "line"
+    __slots__ = ("color", "thickness", "rect")
+
     def __init__(self, x1: int, y1: int, x2: int, y2: int, color: str, thickness: int):
         """Initialize a line drawing command."""
         self.color = color
         self.thickness = thickness
         self.rect = Rect(x1, y1, x2, y2)
 
-    def execute(self, scroll: int, canvas: tkinter.Canvas):
-        """Draw the line on the canvas with scroll offset applied."""
-        canvas.create_line(
-            self.rect.left, self.rect.top - scroll, 
-            self.rect.right, self.rect.bottom - scroll, 
-            fill=self.color, width=self.thickness
+    def execute(self, scroll: int, canvas: tkinter.Canvas, tags: str | tuple = (), item=None) -> int:
+        """Draw the line on the canvas with scroll offset applied and return the canvas item id."""
+        return draw_item(
+            canvas, self.item_type,
+            (self.rect.left, self.rect.top - scroll, self.rect.right, self.rect.bottom - scroll),
+            item, fill=self.color, width=self.thickness, tags=tags
         )
 
 class DrawRect:
     """Draws a filled rectangle."""
 
+    item_type = "rectangle"
+    __slots__ = ("rect", "color", "top", "left", "bottom", "right")
+
     def __init__(self, rect: Rect, color: str):
         """Initialize a rectangle drawing command."""
         self.rect = rect
@@ -78,32 +168,30 @@ class DrawRect:
         self.bottom = rect.bottom
         self.right = rect.right
 
-    def execute(self, scroll: int, canvas: tkinter.Canvas):
-        """Draw the filled rectangle on the canvas."""
-        canvas.create_rectangle(
-            self.rect.left,
-            self.rect.top - scroll,
-            self.rect.right,
-            self.rect.bottom - scroll,
-            width=0,
-            fill=self.color
+    def execute(self, scroll: int, canvas: tkinter.Canvas, tags: str | tuple = (), item=None) -> int:
+        """Draw the filled rectangle on the canvas and return the canvas item id."""
+        return draw_item(
+            canvas, self.item_type,
+            (self.rect.left, self.rect.top - scroll, self.rect.right, self.rect.bottom - scroll),
+            item, width=0, fill=self.color, outline="", tags=tags
         )
 
 class DrawOutline:
     """Draws a rectangle border (outline only, no fill)."""
 
+    item_type = "rectangle"
+    __slots__ = ("rect", "color", "thickness")
+
     def __init__(self, rect: Rect, color: str, thickness: int):
         """Initialize an outline drawing command."""
         self.rect = rect
         self.color = color
         self.thickness = thickness
 
-    def execute(self, scroll: int, canvas: tkinter.Canvas):
-        """Draw the rectangle outline on the canvas."""
-        canvas.create_rectangle(
-            self.rect.left, self.rect.top - scroll,
-            self.rect.right, self.rect.bottom - scroll,
-            width=self.thickness,
-            outline=self.color,
-            fill=""
+    def execute(self, scroll: int, canvas: tkinter.Canvas, tags: str | tuple = (), item=None) -> int:
+        """Draw the rectangle outline on the canvas and return the canvas item id."""
+        return draw_item(
+            canvas, self.item_type,
+            (self.rect.left, self.rect.top - scroll, self.rect.right, self.rect.bottom - scroll),
+            item, width=self.thickness, outline=self.color, fill="", tags=tags
         )
\ No newline at end of file
@@ -1,6 +1,45 @@
 import tkinter as tk
 import tkinter.font
-from constants import FONTS
+from functools import lru_cache
+from string import ascii_letters
+from constants import FONTS, MEASURE_CACHE_SIZE
+
+class MeasuringFont(tkinter.font.Font):
+    """
+    tkinter Font that memoizes text measurements and font metrics.
+
+    Each measure() or metrics() call is a round-trip into the Tcl interpreter, and
+    layout measures the same words ("the", "a", " ") over and over, so widths are
+    cached per font. Metrics (ascent, descent, linespace) never change for a font,
+    so they are fetched from Tk once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Tk measures much faster once a widget uses the font, so a (never packed) label
+        # is attached before anything is measured, including the values primed below
+        self.label = tk.Label(font=self)
+        self._measure = lru_cache(maxsize=MEASURE_CACHE_SIZE)(super().measure)
+        self._metrics = None
+        # Values layout reads for every word, kept as plain attributes so they cost no call at all
+        self.space_width = super().measure(" ")  # Gap between words
+        self.ascent = self.metrics("ascent")
+        self.descent = self.metrics("descent")
+        self.linespace = self.metrics("linespace")
+
+    def measure(self, text: str, displayof=None) -> int:
+        """Return the width of text in pixels, using the cache when possible."""
+        return self._measure(text, displayof)
+
+    def metrics(self, *options, **kw):
+        """Return font metrics, from the cache after the first call."""
+        if kw or len(options) > 1:
+            return super().metrics(*options, **kw)
+        if self._metrics is None:
+            self._metrics = super().metrics()
+        if options:
+            return self._metrics[options[0]]
+        return dict(self._metrics)
 
 def get_font(size: int, weight: str = "normal", style: str = "roman") -> tkinter.font.Font:
     """
@@ -14,11 +53,23 @@ def get_font(size: int, weight: str = "normal", style: str = "roman") -> tkinter
     """
     key = (size, weight, style)
     if key not in FONTS:
-        font = tkinter.font.Font(
+        font = MeasuringFont(
             size=size,
             weight="bold" if weight == "bold" else "normal",
             slant="italic" if style == "italic" else "roman"
         )
-        label = tk.Label(font=font)
-        FONTS[key] = (font, label)
-    return FONTS[key][0]
\ No newline at end of file
+        FONTS[key] = (font, font.label)
+    return FONTS[key][0]
+
+@lru_cache(maxsize=None)
+def font_size(size_str: str) -> int:
+    """
+    Convert a CSS font-size value (like "16px") to a Tk point size.
+
+    Pages only use a handful of distinct sizes, so each string is converted once.
+    Any unit suffix is stripped, so "em" and "pt" values still read as their number.
+
+    :param size_str: CSS font-size value
+    :return: Font size in points
+    """
+    return int(float(size_str.rstrip(ascii_letters)))
@@ -16,7 +16,7 @@
 
 from requests import Text, Element
 from drawing import DrawText, DrawRect, Rect
-from fonts import get_font
+from fonts import get_font, font_size
 from constants import BLOCK_ELEMENTS, CANVAS_WIDTH, HSTEP, WIDTH, VSTEP
 
 # ==============================================================================
@@ -32,6 +32,9 @@ class LineLayout:
     - Vertical positioning of words based on font ascent/descent
     - Line height calculation based on the tallest text in the line
     """
+
+    # The line draws its words itself (see paint), so paint_tree doesn't visit them
+    paints_children = True
     
     def __init__(self, node: Element, parent: 'BlockLayout', previous: 'LineLayout'):
         """
@@ -74,14 +77,21 @@ class LineLayout:
         # Calculate baseline alignment for mixed font sizes
         # All text in a line must sit on the same baseline for proper appearance
         if self.children:
-            # Find the tallest ascender (part of letter above baseline)
-            max_ascent = max([child.font.metrics("ascent") for child in self.children])
+            # Find the tallest ascender (part of letter above baseline) and the deepest
+            # descender in one pass, without building a list of metrics first
+            # Fonts carry their metrics as attributes, so this doesn't call into Tk per word
+            max_ascent = max_descent = 0
+            for word in self.children:
+                if word.font.ascent > max_ascent:
+                    max_ascent = word.font.ascent
+                if word.font.descent > max_descent:
+                    max_descent = word.font.descent
+            
             baseline = self.y + max_ascent # Remember that y is the top of the line
             for word in self.children:
-                word.y = baseline - word.font.metrics("ascent")
+                word.y = baseline - word.font.ascent
             
             # Calculate line height as tallest ascent + deepest descent
-            max_descent = max([word.font.metrics("descent") for word in self.children])
             self.height = max_ascent + max_descent
         else:
             # Empty line has no height
@@ -89,13 +99,29 @@ class LineLayout:
 
     def paint(self):
         """
-        Generate drawing commands for this line.
+        Generate drawing commands for the words in this line.
         
-        LineLayout itself has nothing to paint - individual words handle their own drawing.
+        Words are laid out one space (in their font) apart, so a run of neighbouring
+        words in the same font and color looks the same drawn as one string ("a b c")
+        as drawn word by word. Each run becomes a single DrawText, which cuts the
+        number of canvas items to roughly one per line.
         
-        :return: Empty list
+        :return: List of DrawText commands, one per run of same-styled words
         """
-        return []
+        cmds = []
+        run = []  # Words in the current run
+        first = None  # First TextLayout of the current run
+        for word in self.children:
+            color = word.node.style["color"] # type: ignore
+            if first is not None and word.font is first.font and color == run_color:
+                run.append(word.word)
+                continue
+            if first is not None:
+                cmds.append(DrawText(first.x, first.y, " ".join(run), run_color, first.font)) # type: ignore
+            first, run, run_color = word, [word.word], color
+        if first is not None:
+            cmds.append(DrawText(first.x, first.y, " ".join(run), run_color, first.font)) # type: ignore
+        return cmds
 
 # ==============================================================================
 # TEXT LAYOUT CLASS
@@ -106,10 +132,12 @@ class TextLayout:
     Represents a single word or text fragment within a line.
     
     This is the atomic unit of text layout - each TextLayout object represents
-    one word that will be drawn as a single DrawText command.
+    one word, drawn by its line as part of a run of same-styled words.
     """
     
-    def __init__(self, node: Element, word: str, parent: LineLayout, previous: 'TextLayout'):
+    paints_children = False  # Children paint themselves
+    
+    def __init__(self, node: Element, word: str, parent: LineLayout, previous: 'TextLayout', font=None):
         """
         Initialize a text layout for a single word.
         
@@ -117,12 +145,14 @@ class TextLayout:
         :param word: The actual text string to display
         :param parent: LineLayout that contains this word
         :param previous: Previous TextLayout in the same line (for horizontal positioning)
+        :param font: The node's font if already known, looked up from its style during layout otherwise
         """
         self.node = node           # HTML/CSS node for styling information
         self.word = word           # Text content to display
         self.children = []         # TextLayout has no children (leaf node)
         self.parent = parent       # Parent LineLayout
         self.previous = previous   # Previous word in line (for spacing)
+        self.font = font           # Font the word is drawn in
 
     def layout(self):
         """
@@ -134,21 +164,23 @@ class TextLayout:
         3. Positions horizontally after previous word (with space)
         4. Sets height based on font line spacing
         """
-        # Extract font properties from CSS styles
-        weight = self.node.style["font-weight"] # type: ignore
-        style = self.node.style["font-style"] # type: ignore
-        if style == "normal": style = "roman"  # tkinter uses "roman" instead of "normal"
-        
-        # Convert CSS pixel size to tkinter points
-        size = int(float(self.node.style["font-size"][:-2])) # type: ignore
-        self.font = get_font(size, weight, style)
+        # Extract font properties from CSS styles, unless the block already resolved
+        # the font once for the whole text node
+        if self.font is None:
+            weight = self.node.style["font-weight"] # type: ignore
+            style = self.node.style["font-style"] # type: ignore
+            if style == "normal": style = "roman"  # tkinter uses "roman" instead of "normal"
+            
+            # Convert CSS pixel size to tkinter points
+            size = font_size(self.node.style["font-size"]) # type: ignore
+            self.font = get_font(size, weight, style)
 
         self.width = self.font.measure(self.word)
         
         # Position horizontally
         if self.previous:
             # Add space between words
-            space = self.previous.font.measure(" ")
+            space = self.previous.font.space_width
             if self.previous.x is not None:
                 self.x = self.previous.x + self.previous.width + space
         else:
@@ -156,16 +188,18 @@ class TextLayout:
             self.x = self.parent.x
 
         # Height is font's total line spacing
-        self.height = self.font.metrics("linespace")
+        self.height = self.font.linespace
 
     def paint(self):
         """
-        Generate drawing command for this text.
+        Generate drawing commands for this text.
+        
+        Words are drawn by their LineLayout, which merges neighbouring words
+        with the same style into a single DrawText.
         
-        :return: List containing one DrawText command
+        :return: Empty list
         """
-        color = self.node.style["color"] # type: ignore
-        return [DrawText(self.x, self.y, self.word, color, self.font)] # type: ignore
+        return []
 
 # ==============================================================================
 # BLOCK LAYOUT CLASS
@@ -185,6 +219,8 @@ class BlockLayout:
     "inline mode" (containing text that wraps into lines).
     """
     
+    paints_children = False  # Children paint themselves
+    
     def __init__(self, node: Element, parent: 'DocumentLayout', previous: 'BlockLayout'):
         """
         Initialize a block layout element.
@@ -211,16 +247,42 @@ class BlockLayout:
         self.line = []             # Current line being built (old system)
         self.display_list = []     # Drawing commands (old system)
         self.centre_line = False   # Whether to center the current line
+        self._mode = None          # Cached result of layout_mode()
 
     def layout(self):
         """
         Calculate layout for this block and all its children.
         
+        Nested blocks are laid out with an explicit stack rather than by recursing into
+        each child's layout(), which avoids a Python call chain as deep as the page and
+        can't hit the recursion limit. The order is the same as recursion: each block
+        is positioned and its children laid out in order, and its height is taken
+        from its children once they are all done.
+        """
+        # (block, children_done) - a block is pushed again below its children so its
+        # height is computed after theirs
+        stack = [(self, False)]
+        while stack:
+            block, children_done = stack.pop()
+            if children_done:
+                # Total height is sum of all child heights
+                block.height = sum(child.height for child in block.children)
+                continue
+            child_blocks = block.layout_self()
+            stack.append((block, True))
+            # Push in reverse so the first child (which the next one is positioned after) is laid out first
+            stack.extend((child, False) for child in reversed(child_blocks))
+
+    def layout_self(self):
+        """
+        Lay out this block without laying out its child blocks.
+        
         This method:
         1. Sets position and width based on parent
         2. Determines layout mode (block vs inline)
-        3. Creates and layouts child elements appropriately
-        4. Calculates total height from children
+        3. Creates child elements, laying out lines of inline content straight away
+        
+        :return: Child BlockLayouts still to be laid out (empty in inline mode)
         """
         # Block takes full width of parent and aligns to left
         self.x = self.parent.x
@@ -242,22 +304,17 @@ class BlockLayout:
                 next_block = BlockLayout(child, self, previous) # type: ignore
                 self.children.append(next_block)
                 previous = next_block
+            return self.children
 
-            # Layout all child blocks
-            for child in self.children:
-                child.layout()
-        else:
-            # Inline mode: children are text that flows into lines
-            # Create line structure for text content
-            self.new_line()
-            self.recurse(self.node)
-            
-            # Layout all line children
-            for child in self.children:
-                child.layout()
-
-        # Total height is sum of all child heights
-        self.height = sum([child.height for child in self.children])
+        # Inline mode: children are text that flows into lines
+        # Create line structure for text content
+        self.new_line()
+        self.recurse(self.node)
+        
+        # Layout all line children
+        for child in self.children:
+            child.layout()
+        return []
 
     def paint(self):
         """
@@ -283,40 +340,53 @@ class BlockLayout:
         
         :return: "block" or "inline"
         """
+        # The node's children don't change after parsing, so the mode is worked out once
+        if self._mode:
+            return self._mode
         if isinstance(self.node, Text):
-            return "inline"
-        elif any([isinstance(child, Element) and child.tag in BLOCK_ELEMENTS
-                  for child in self.node.children]):
-            return "block"
+            mode = "inline"
+        elif any(child.tag in BLOCK_ELEMENTS
+                 for child in self.node.children if isinstance(child, Element)):
+            mode = "block"
         elif self.node.children:
-            return "inline"
+            mode = "inline"
         else:
-            return "block"
+            mode = "block"
+        self._mode = mode
+        return mode
 
     def recurse(self, node):
         """
-        Recursively process node tree to extract text and create lines.
+        Process a node tree to extract text and create lines.
         
         This method walks through the HTML tree and:
         - Splits text nodes into individual words
         - Handles special elements like <br> (line breaks)
         - Processes styling elements like <h1> (centering)
         
+        The walk uses an explicit stack in document order rather than recursion,
+        like paint_tree, so deeply nested inline markup can't hit the recursion limit.
+        
         :param node: Current HTML node to process
         """
-        if isinstance(node, Text):
-            # Text node: split into words and add each to current line
-            for word in node.text.split():
-                self.word(node, word) # type: ignore
-        else:
-            # Element node: handle special cases and process children
-            if node.tag == "br":
-                # Line break: force new line
-                self.new_line()
-            if node.tag == "h1":
-                self.centre_line = True
-            for child in node.children:
-                self.recurse(child)
+        stack = [node]
+        while stack:
+            # Text and Element each know how to lay themselves out, so dispatching
+            # through the node replaces an isinstance check per node
+            children = stack.pop().recurse_layout(self)
+            stack.extend(reversed(children))
+
+    def open_tag(self, tag: str):
+        """
+        Handle the start of an element met while laying out inline content.
+        
+        :param tag: Tag name of the element
+        """
+        if tag == "br":
+            # Line break: force new line
+            self.new_line()
+        if tag == "h1":
+            self.centre_line = True
 
     def flush(self):
         """
@@ -358,7 +428,21 @@ class BlockLayout:
         self.cursor_x = 0
         self.line = []
 
-    def word(self, node: Element, word: str):
+    def node_font(self, node: Element):
+        """
+        Get the font a node's text is drawn in, from its CSS font properties.
+        
+        :param node: HTML node to get the font for
+        :return: tkinter Font object
+        """
+        weight = node.style.get("font-weight", "normal") # type: ignore
+        style = node.style.get("font-style", "normal") # type: ignore
+        if style == "normal":
+            style = "roman"
+        size = font_size(node.style.get("font-size", "16px")) # type: ignore
+        return get_font(size, weight, style)
+
+    def word(self, node: Element, word: str, font=None):
         """
         Add a word to the current line, handling word wrapping.
         
@@ -371,17 +455,10 @@ class BlockLayout:
         
         :param node: HTML node containing this word (for styling)
         :param word: Text content of the word
+        :param font: The node's font if already known, looked up from its style otherwise
         """
-        # Extract CSS font properties
-        weight = node.style.get("font-weight", "normal") # type: ignore
-        style = node.style.get("font-style", "normal") # type: ignore
-        if style == "normal":
-            style = "roman"
-        size_str = node.style.get("font-size", "16px") # type: ignore
-        size = int(float(size_str[:-2]))  # Convert CSS px to Tk points
-        color = node.style.get("color", "black") # type: ignore
-
-        font = get_font(size, weight, style)
+        if font is None:
+            font = self.node_font(node)
         w = font.measure(word)
 
         # Get the current line (or create one if it doesn't exist)
@@ -395,26 +472,27 @@ class BlockLayout:
             line = self.children[-1]
 
         # Add word to current line
-        self.add_word_to_line(node, word, line)
+        self.add_word_to_line(node, word, line, font, w)
 
-    def add_word_to_line(self, node: Element, word: str, line: LineLayout):
+    def add_word_to_line(self, node: Element, word: str, line: LineLayout, font, w: int):
         """
         Add a TextLayout object to the specified line.
         
         :param node: HTML node for styling
         :param word: Text content
         :param line: LineLayout to add the word to
+        :param font: The node's font
+        :param w: Width of the word in that font, as already measured by word()
         """
         # Find previous word in line for positioning
         previous_word = line.children[-1] if line.children else None
-        text = TextLayout(node, word, line, previous_word) # type: ignore
+        text = TextLayout(node, word, line, previous_word, font) # type: ignore
         line.children.append(text)
         
-        # Update cursor position for word wrapping (rough estimate)
-        # Actual positioning happens in TextLayout.layout()
-        font = get_font(16, "normal", "roman")  # Default font for estimation
-        space = font.measure(" ") if previous_word else 0
-        self.cursor_x += font.measure(word) + space
+        # Update cursor position for word wrapping, spacing words the same way
+        # TextLayout.layout() will (by the previous word's font)
+        space = previous_word.font.space_width if previous_word else 0
+        self.cursor_x += w + space
 
     def new_line(self):
         """
@@ -458,6 +536,8 @@ class DocumentLayout:
     - Handles the interface between the browser and layout system
     """
     
+    paints_children = False  # Children paint themselves
+    
     def __init__(self, node: Element):
         """
         Initialize the document layout.
@@ -490,8 +570,9 @@ class DocumentLayout:
         self.y = VSTEP                  # Start content after top margin
         
         # Create single child BlockLayout for all content
+        # (replacing the previous one, so re-laying out doesn't keep stale trees around)
         child = BlockLayout(self.node, self, None) # type: ignore
-        self.children.append(child)
+        self.children = [child]
         
         # Layout all content (this recursively layouts everything)
         child.layout()
@@ -516,17 +597,20 @@ def tree_to_list(tree, list):
     """
     Flatten a layout tree into a list by walking all nodes.
     
-    This utility function recursively visits every node in the layout tree
-    and adds it to a flat list. Useful for operations that need to process
-    all layout objects regardless of hierarchy.
+    This utility function visits every node in the layout tree and adds it
+    to a flat list. Useful for operations that need to process all layout
+    objects regardless of hierarchy. Like paint_tree, it walks with an explicit
+    stack, giving the same order as recursion (parents before children).
     
     :param tree: Root layout object to start from
     :param list: List to append nodes to
     :return: The modified list
     """
-    list.append(tree)
-    for child in tree.children:
-        tree_to_list(child, list)
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        list.append(node)
+        stack.extend(reversed(node.children))
     return list
 
 def paint_tree(layout_object, display_list):
@@ -537,11 +621,22 @@ def paint_tree(layout_object, display_list):
     object, collecting all drawing commands into a single display list.
     The browser can then execute these commands to render the page.
     
+    The walk uses an explicit stack rather than recursion, which avoids a Python
+    call per layout object and can't hit the recursion limit on deep pages.
+    Objects are still painted in the same order (parents before children,
+    children left to right).
+    
     :param layout_object: Layout object to start painting from
     :param display_list: List to append drawing commands to
     """
-    # Add this object's drawing commands
-    display_list.extend(layout_object.paint())
-    
-    for child in layout_object.children:
-        paint_tree(child, display_list)
\ No newline at end of file
+    stack = [layout_object]
+    while stack:
+        obj = stack.pop()
+        
+        # Add this object's drawing commands
+        display_list.extend(obj.paint())
+        
+        # Push children in reverse so the first child is painted next, unless the
+        # object already painted them (a line draws its words as merged runs)
+        if not obj.paints_children:
+            stack.extend(reversed(obj.children))
\ No newline at end of file
@@ -15,8 +15,9 @@
 import socket
 import sys
 import ssl
+import re
 
-from constants import SOCKET, ENTITIES, SELF_CLOSING_TAGS
+from constants import ENTITIES, SELF_CLOSING_TAGS
 
 # ==============================================================================
 # HTML NODE CLASSES
@@ -39,6 +40,9 @@ class Text:
         :param parent: Parent Element that contains this text
         """
         self.text = text        # The actual text content
+        # Split once here rather than on every layout. Words are interned, so common words
+        # ("the", "and") share one string and cache lookups on them compare by identity
+        self.words = tuple(map(sys.intern, text.split()))
         self.children = []      # Text nodes have no children (always empty)
         self.parent = parent    # Parent element in the HTML tree
     
@@ -46,6 +50,19 @@ class Text:
         """String representation for debugging."""
         return repr(self.text)
 
+    def recurse_layout(self, layout):
+        """
+        Lay this text out inline, word by word (see BlockLayout.recurse).
+        
+        :param layout: BlockLayout the text flows into
+        :return: Child nodes still to lay out (always empty for text)
+        """
+        # Every word of a text node shares its style, so the font is resolved once per node
+        font = layout.node_font(self)
+        for word in self.words:
+            layout.word(self, word, font)
+        return self.children
+
 class Element:
     """
     Represents an HTML element (tag) in the document tree.
@@ -71,10 +88,25 @@ class Element:
         """String representation for debugging."""
         return "<" + self.tag + ">"
 
+    def recurse_layout(self, layout):
+        """
+        Start laying this element out inline (see BlockLayout.recurse).
+        
+        :param layout: BlockLayout the content flows into
+        :return: Child nodes to lay out next, in order
+        """
+        layout.open_tag(self.tag)
+        return self.children
+
 # ==============================================================================
 # HTML PARSER CLASS
 # ==============================================================================
 
+# Characters that end a run of plain text / tag content, and runs of whitespace to collapse
+TEXT_END = re.compile(r"[<&]")
+TAG_END = re.compile(r"[<>]")
+WHITESPACE = re.compile(r"\s+")
+
 class HTMLParser:
     """
     Converts raw HTML text into a structured tree of Element and Text nodes.
@@ -88,14 +120,16 @@ class HTMLParser:
     - Whitespace normalization
     """
     
-    def __init__(self, body: str):
+    def __init__(self, body: str = ""):
         """
         Initialize the HTML parser.
         
-        :param body: Raw HTML text to parse
+        :param body: Raw HTML text to parse (can be empty when the text is supplied with feed())
         """
-        self.body = body            # Raw HTML text to parse
+        self.body = body            # Raw HTML text not yet consumed by the parser
         self.unfinished = []        # Stack of currently open tags (not yet closed)
+        self.buffer = ""            # Accumulates characters as we build tags/text
+        self.in_tag = False         # Whether we're currently inside angle brackets < >
         
         # Tags that belong in the document <head> section
         self.HEAD_TAGS = [
@@ -116,11 +150,49 @@ class HTMLParser:
         
         :return: Root HTML element containing the entire parsed tree
         """
-        buffer = ""         # Accumulates characters as we build tags/text
-        in_tag = False     # Whether we're currently inside angle brackets < >
-        i = 0              # Current position in the HTML text
+        return self.close()
+
+    def feed(self, chunk: str):
+        """
+        Parse another piece of HTML text as it arrives (e.g. from the network).
+        
+        Lets parsing overlap with downloading: each chunk is consumed immediately,
+        except for a possible HTML entity at the very end, which is held back until
+        the next chunk shows whether it is complete.
+        
+        :param chunk: Next piece of raw HTML text
+        """
+        self.body += chunk
+        self.consume(final=False)
+
+    def close(self) -> Element:
+        """
+        Parse any remaining text and return the root element.
+        
+        :return: Root HTML element containing the entire parsed tree
+        """
+        self.consume(final=True)
+        
+        # Add any remaining text at the end
+        if not self.in_tag and self.buffer:
+            self.add_text(self.buffer)
+            self.buffer = ""
 
-        # Main parsing loop - process each character
+        return self.finish()
+
+    def consume(self, final: bool):
+        """
+        Scan through the unconsumed HTML text, building the element tree.
+        
+        :param final: Whether no more text will arrive (so a trailing '&' can't be
+                      the start of an entity split across chunks)
+        """
+        buffer = self.buffer    # Accumulates characters as we build tags/text
+        in_tag = self.in_tag    # Whether we're currently inside angle brackets < >
+        i = 0                   # Current position in the unconsumed HTML text
+
+        # Main parsing loop - handle each special character, and scan the runs of plain
+        # text or tag content between them with regular expressions (which run in C)
         while i < len(self.body):
             char = self.body[i]
             
@@ -159,6 +231,9 @@ class HTMLParser:
                 
             elif not in_tag and char == "&":
                 # Handle HTML entities like &amp;, &lt;, &gt;
+                # Wait for more text if the longest entity could run past the end of this chunk
+                if not final and i + 7 > len(self.body):
+                    break
                 matched = False
                 
                 # Try different entity lengths (most are 4-7 characters)
@@ -177,24 +252,28 @@ class HTMLParser:
                     i += 1
                     
             elif not in_tag:
-                # Regular text content (not inside a tag)
-                # Normalize whitespace - collapse multiple spaces/newlines into single space
-                if char.isspace():
-                    if buffer and not buffer.endswith(" "):
-                        buffer += " "
-                else:
-                    buffer += char
-                i += 1
+                # Regular text content (not inside a tag), taken in one go up to the next tag or entity
+                match = TEXT_END.search(self.body, i)
+                end = match.start() if match else len(self.body)
+                
+                # Normalize whitespace - collapse multiple spaces/newlines into single space,
+                # dropping it entirely at the start of the text or straight after another space
+                text = WHITESPACE.sub(" ", self.body[i:end])
+                if text.startswith(" ") and (not buffer or buffer.endswith(" ")):
+                    text = text[1:]
+                buffer += text
+                i = end
             else:
-                # We're inside a tag, accumulate the tag content
-                buffer += char
-                i += 1
-        
-        # Add any remaining text at the end
-        if not in_tag and buffer:
-            self.add_text(buffer)
-
-        return self.finish()
+                # We're inside a tag, accumulate the tag content up to the next angle bracket
+                match = TAG_END.search(self.body, i)
+                end = match.start() if match else len(self.body)
+                buffer += self.body[i:end]
+                i = end
+        
+        # Remember where we got to for the next chunk
+        self.body = self.body[i:]
+        self.buffer = buffer
+        self.in_tag = in_tag
     
     def get_attributes(self, text: str) -> tuple[str, dict]:
         """
@@ -404,6 +483,7 @@ class URL:
         self.path = None      # /page.html
         self.entity = None    # Special marker for data: and view-source:
         self.content = None   # Content for data: URLs
+        self.status = None    # HTTP status of the last request, None if it failed before a response
 
         # Parse special URL schemes first
         if "data" in url:
@@ -500,42 +580,57 @@ class URL:
         """
         Fetch the content from this URL.
         
+        :return: Content of the web page (HTML, CSS, etc.)
+        """
+        return "".join(self.request_stream())
+
+    def request_stream(self, chunk_size: int = 4096):
+        """
+        Fetch the content from this URL, yielding it in pieces as it arrives.
+        
         This method:
         1. Opens a socket connection to the server
         2. Sends an HTTP request
         3. Receives and parses the HTTP response
         4. Handles redirects
-        5. Returns the content
+        5. Yields the content a chunk at a time, so it can be parsed while the
+           rest is still downloading
         
-        :return: Content of the web page (HTML, CSS, etc.)
+        If the page couldn't be fetched a blank page is yielded instead and `status`
+        is left as None, so callers can tell it apart from real content.
+        
+        :param chunk_size: Maximum number of characters per chunk
+        :return: Iterator over pieces of the web page content (HTML, CSS, etc.)
         """
+        self.status = None
         try:
             # Create and configure socket connection
-            global SOCKET
+            # (kept local rather than global so several requests can run at once on different threads)
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
             s.settimeout(30)
             s.connect((self.host, self.port))
             if self.scheme == "https":
                 ctx = ssl.create_default_context()
-                SOCKET = ctx.wrap_socket(s, server_hostname=self.host)
+                sock = ctx.wrap_socket(s, server_hostname=self.host)
             else:
-                SOCKET = s
+                sock = s
                 
         except socket.error as e:
             print(f"Socket error: {e}")
-            return self.blank_page()
+            yield self.blank_page()
+            return
         
         # Build HTTP request
         request = f"GET {self.path} HTTP/1.1\r\n"
         request += f"Host: {self.host}\r\n"
         request += "User-Agent: Python Browser\r\n"
         request += "Connection: close\r\n\r\n" # Remember to end the headers with a blank line so 2 \r\n is sent
-        SOCKET.send(request.encode("utf8"))
+        sock.send(request.encode("utf8"))
 
         # use "rb" for keep-alive compatibility and .decode manually for reading and remove encoding parameter
         # We decode manually as the content-length can't be tracked when the internal makefile command is converting bytes to text
         # resulting in a hang as it waits for more data that never comes.
-        response = SOCKET.makefile("r", encoding="utf8", newline='\r\n')
+        response = sock.makefile("r", encoding="utf8", newline='\r\n')
         
         # Parse status line: "HTTP/1.1 200 OK"
         status_line = response.readline()
@@ -554,7 +649,10 @@ class URL:
             new_url = self.url_redirect(response_headers)
             if new_url:
                 print(f"Redirecting to {new_url}")
-                return URL(new_url).request()
+                target = URL(new_url)
+                yield from target.request_stream(chunk_size)
+                self.status = target.status
+                return
             else:
                 raise Exception(f"Redirection not supported for {self.scheme} scheme")
         
@@ -564,26 +662,33 @@ class URL:
             assert "content-encoding" not in response_headers, "Content encoding is not supported"
         except AssertionError as e:
             print(f"Error during assert: {e}")
-            return self.blank_page()
+            yield self.blank_page()
+            return
+        self.status = status
 
         # Read response body
         if "content-length" in response_headers.keys():
-            content_length = int(response_headers["content-length"])
-            chunk = response.read(content_length)
-            
-            # Handle both bytes and string responses
-            if isinstance(chunk, bytes):
-                # Binary mode - we got bytes
-                content = chunk.decode("utf8")
-            else:
-                # Text mode - we got a string
-                content = chunk
+            remaining = int(response_headers["content-length"])
+            while remaining > 0:
+                chunk = response.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                
+                # Handle both bytes and string responses
+                if isinstance(chunk, bytes):
+                    # Binary mode - we got bytes
+                    chunk = chunk.decode("utf8")
+                remaining -= len(chunk)
+                yield chunk
         else:
             # If no content-length, read until end of file
-            content = response.read()
+            while True:
+                chunk = response.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
 
-        SOCKET.close()
-        return content
+        sock.close()
     
     def resolve(self, url: str) -> 'URL':
         """
@@ -0,0 +1,115 @@
+# ==============================================================================
+# VIEWPORT CULLING CHECK
+# ==============================================================================
+# Tab.draw finds the visible commands with binary searches over the packed bounds
+# built by Tab.paint_display_list, plus a separate pass over commands taller than the
+# window. This checks, on randomized pages and scroll sequences, that the commands it
+# keeps on the canvas are exactly the ones the plain rule selects:
+#
+#     top <= scroll + tab_height and bottom >= scroll
+#
+# Run with: python -m unittest test_culling
+# ==============================================================================
+
+import os
+import random
+import unittest
+from array import array
+from unittest import mock
+
+# browser.py reads browser.css relative to the working directory when imported
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+import browser
+
+class FakeCommand:
+    """Drawing command with just the bounds and the execute() Tab.draw needs."""
+
+    item_type = "text"
+
+    def __init__(self, top: int, bottom: int):
+        self.top = top
+        self.bottom = bottom
+
+    def execute(self, scroll, canvas, tags=(), item=None):
+        canvas.drawn.append(self)
+        return item if item is not None else object()
+
+class FakeCanvas:
+    """Records the commands executed on it."""
+
+    def __init__(self):
+        self.drawn = []
+
+class FakePool:
+    """Item pool that never has anything to recycle."""
+
+    def acquire(self, item_type):
+        return None
+
+    def release(self, item_type, item):
+        pass
+
+class CullingTest(unittest.TestCase):
+
+    TAB_HEIGHT = 100
+
+    def make_tab(self, cmds):
+        """Build a Tab whose display list is indexed from the given commands."""
+        # Tab.__init__ needs a whole Browser, so only the state drawing reads is set up
+        tab = browser.Tab.__new__(browser.Tab)
+        tab.tab_height = self.TAB_HEIGHT
+        tab.scroll = 0
+        tab.document = None
+        tab.display_list = []
+        tab._tops = array("d")
+        tab._bottoms = array("d")
+        tab._max_bottoms = array("d")
+        tab._tall = []
+        with mock.patch.object(browser, "paint_tree", lambda doc, dl: dl.extend(cmds)), \
+             mock.patch.object(browser, "tree_to_list", lambda tree, out: out):
+            tab.paint_display_list()
+        return tab
+
+    def check_scrolling(self, rng, cmds, page_height):
+        tab = self.make_tab(cmds)
+        display_list = tab.display_list
+        items, canvas = {}, FakeCanvas()
+        tab.draw(canvas, 0, items, FakePool())
+        for _ in range(40):
+            old_scroll = tab.scroll
+            step = rng.choice([-300, -20, -10, 10, 20, 30, 300, 1000])
+            tab.scroll = max(0, min(page_height, old_scroll + step))
+            canvas.drawn = []
+            # Mostly incremental scroll updates, sometimes a fresh draw over the same items
+            tab.draw(canvas, 0, items, FakePool(), old_scroll if rng.random() < 0.8 else None)
+
+            scroll = tab.scroll
+            expected = {
+                i for i, cmd in enumerate(display_list)
+                if cmd.top <= scroll + self.TAB_HEIGHT and cmd.bottom >= scroll
+            }
+            self.assertEqual(set(items), expected)
+
+            # New items are created in display list order, so later commands stack on top
+            order = [display_list.index(cmd) for cmd in canvas.drawn]
+            self.assertEqual(order, sorted(order))
+
+    def test_dense_page(self):
+        rng = random.Random(5)
+        for _ in range(30):
+            cmds = [FakeCommand(0, 5000), FakeCommand(100, 3000)]
+            cmds += [FakeCommand(y, y + rng.randint(5, 30)) for y in range(0, 5000, 10)]
+            cmds.append(FakeCommand(2000, 4500))
+            self.check_scrolling(rng, cmds, 4900)
+
+    def test_sparse_page_with_tall_commands(self):
+        # Gaps between short commands leave the viewport with no short command in it,
+        # where only the tall-command pass decides what is drawn
+        rng = random.Random(7)
+        for _ in range(30):
+            tops = sorted(rng.sample(range(0, 5000, 10), 40))
+            cmds = [FakeCommand(y, y + rng.choice([10, 20, 400, 3000])) for y in tops]
+            self.check_scrolling(rng, cmds, 4900)
+
+if __name__ == "__main__":
+    unittest.main()